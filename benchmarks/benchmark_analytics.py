@@ -0,0 +1,95 @@
+"""
+Benchmark SpendingAnalytics on synthetic expenses stored in a temporary SQLite database
+
+Usage: python benchmarks/benchmark_analytics.py --expenses 2000000 --users 20000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database import Database
+from utils.analytics import SpendingAnalytics
+
+def generate_expenses(expenses, users, categories, start_date, end_date, seed):
+    """Generate (user_id, category_id, amount, description, date) rows for executemany"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start_date, end_date, freq='D').strftime('%Y-%m-%d').to_numpy()
+    return zip(
+        rng.integers(1, users + 1, expenses).tolist(),
+        rng.integers(1, categories + 1, expenses).tolist(),
+        rng.gamma(2.0, 10.0, expenses).round(2).tolist(),
+        ['Synthetic'] * expenses,
+        dates[rng.integers(0, len(dates), expenses)].tolist()
+    )
+
+def timed(label, func, *args, **kwargs):
+    """Run func once and print how long it took"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"{label:<32} {time.perf_counter() - start:8.3f}s")
+    return result
+
+def load_database(db, args, month_start, month_end, history_start):
+    """Insert synthetic users, budgets and expenses in a single transaction"""
+    category_ids = [row[0] for row in db.get_categories()]
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('BEGIN')
+        cursor.executemany(
+            'INSERT INTO users (id, username, email) VALUES (?, ?, ?)',
+            ((i, f'user{i}', f'user{i}@example.com') for i in range(1, args.users + 1))
+        )
+        cursor.executemany(
+            'INSERT INTO budgets (user_id, category_id, amount, month) VALUES (?, ?, ?, ?)',
+            ((i, c, 500.0, month_start.strftime('%Y-%m-%d')) for i in range(1, args.users + 1) for c in category_ids)
+        )
+        cursor.executemany(
+            'INSERT INTO expenses (user_id, category_id, amount, description, date) VALUES (?, ?, ?, ?, ?)',
+            generate_expenses(args.expenses, args.users, len(category_ids), history_start, month_end, args.seed)
+        )
+        cursor.execute('COMMIT')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--expenses', type=int, default=2_000_000)
+    parser.add_argument('--users', type=int, default=20_000)
+    parser.add_argument('--month', default='2024-03-01')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # Database always writes to database/expenses.db under the working directory
+        os.chdir(workdir)
+        db = Database()
+        analytics = SpendingAnalytics(db)
+
+        month_start = pd.Timestamp(args.month).replace(day=1)
+        month_end = month_start + pd.Timedelta(days=month_start.days_in_month - 1)
+        history_start = month_start - pd.Timedelta(days=max(analytics.window, analytics.anomaly_window))
+        print(f"{args.expenses:,} expenses, {args.users:,} users, "
+              f"{history_start:%Y-%m-%d} to {month_end:%Y-%m-%d}")
+
+        timed('load database', load_database, db, args, month_start, month_end, history_start)
+
+        start, end = history_start.strftime('%Y-%m-%d'), month_end.strftime('%Y-%m-%d')
+        rows = timed('get_daily_spending (all users)', db.get_daily_spending, start, end)
+        keys, dates, matrix = timed('build_spend_matrix', analytics.build_spend_matrix, rows, history_start, month_end)
+        timed('rolling_mean', analytics.rolling_mean, matrix)
+        timed('z_scores', analytics.z_scores, matrix)
+        timed('daily_pace', analytics.daily_pace, matrix[:, dates >= month_start])
+        print(f"{'matrix shape':<32} {matrix.shape[0]:,} x {matrix.shape[1]}")
+
+        forecast = timed('forecast (all users)', analytics.forecast, month_start, as_of=month_end)
+        timed('get_daily_spending (one user)', db.get_daily_spending, start, end, 1)
+        timed('forecast (one user)', analytics.forecast, month_start, as_of=month_end, user_id=1)
+        print(f"{'series forecast':<32} {len(forecast):,}")
+
+if __name__ == "__main__":
+    main()
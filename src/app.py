@@ -5,10 +5,12 @@ from datetime import datetime, timedelta
 import calendar
 from database import Database
 from utils.alerts import AlertManager
+from utils.analytics import SpendingAnalytics
 
-# Initialize database and alert manager
+# Initialize database, alert manager and analytics
 db = Database()
 alert_manager = AlertManager()
+analytics = SpendingAnalytics(db)
 
 def init_session_state():
     """Initialize session state variables"""
@@ -92,6 +94,24 @@ def log_expense():
                             alert_message
                         )
                         st.warning(f"Budget alert for {category}! Check your email for details.")
+                    else:
+                        # Warn early if the current pace will overshoot the budget,
+                        # forecasting up to the expense date if it is later this month
+                        as_of = max(date, datetime.now().date())
+                        forecast = analytics.forecast(month_start, as_of=as_of, user_id=st.session_state.user_id)
+                        forecast = forecast[forecast['category_id'] == category_id]
+
+                        if not forecast.empty:
+                            row = forecast.iloc[0]
+                            projected = row['projected']
+                            if alert_manager.check_projected_overspend(projected, budget, row['days_elapsed']):
+                                alert_message = alert_manager.generate_projection_alert(category, row['spent'], projected, budget)
+                                alert_manager.send_email_alert(
+                                    st.session_state.email,
+                                    f"Spending Forecast - {category}",
+                                    alert_message
+                                )
+                                st.warning(f"You are on pace to overspend your {category} budget (projected ${projected:.2f} of ${budget:.2f}).")
                     break
 
 def set_budget():
@@ -178,6 +198,45 @@ def view_reports():
             })
         
         st.table(pd.DataFrame(budget_data))
+
+        # Month-end forecast
+        st.subheader("Month-End Forecast")
+        forecast = analytics.forecast(month_date, user_id=st.session_state.user_id)
+
+        if not forecast.empty:
+            forecast['on_pace_to_overspend'] = alert_manager.check_projected_overspend(
+                forecast['projected'], forecast['budget'], forecast['days_elapsed']
+            )
+
+            for _, row in forecast[forecast['on_pace_to_overspend']].iterrows():
+                st.warning(f"On pace to overspend {row['category_name']}: projected ${row['projected']:.2f} of ${row['budget']:.2f} budget.")
+
+            # Anomaly scores are for the forecast date, which is only today for the current month
+            today = datetime.now()
+            if (month_date.year, month_date.month) == (today.year, today.month):
+                for _, row in forecast[forecast['unusual_spend']].iterrows():
+                    st.info(f"Unusually high {row['category_name']} spending today ({row['z_score']:.1f} standard deviations above your recent average).")
+
+            chart_data = forecast.melt(
+                id_vars='category_name',
+                value_vars=['spent', 'projected', 'budget'],
+                var_name='Measure',
+                value_name='Amount'
+            )
+            fig3 = px.bar(chart_data, x='category_name', y='Amount', color='Measure', barmode='group', title='Projected Month-End Spending')
+            st.plotly_chart(fig3)
+
+            st.table(pd.DataFrame({
+                'Category': forecast['category_name'],
+                'Spent': forecast['spent'].round(2),
+                f'{analytics.window}-Day Average': forecast['rolling_average'].round(2),
+                'Daily Pace': forecast['daily_pace'].round(2),
+                'Projected': forecast['projected'].round(2),
+                'Budget': forecast['budget'],
+                'Status': forecast['on_pace_to_overspend'].map({True: 'On pace to overspend', False: 'On track'})
+            }))
+        else:
+            st.info("No spending recorded this month to forecast.")
     else:
         st.info("No expenses found for the selected date range.")
 
@@ -83,6 +83,9 @@ class Database:
                     FOREIGN KEY (expense_id) REFERENCES expenses(id),
                     FOREIGN KEY (paid_by) REFERENCES users(id)
                 );
+
+                CREATE INDEX IF NOT EXISTS idx_expenses_user_date ON expenses(user_id, date);
+                CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date);
             ''')
 
             # Insert default categories
@@ -230,6 +233,52 @@ class Database:
             cursor.execute(query, (user_id, month, user_id, month))
             return cursor.fetchall()
 
+    def get_categories(self):
+        """Get all categories as (id, name) rows"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT id, name FROM categories ORDER BY id')
+            return cursor.fetchall()
+
+    def get_daily_spending(self, start_date, end_date, user_id=None):
+        """Get total spend per user, category and day within a date range.
+        Covers all users unless user_id is given."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            query = '''
+                SELECT user_id, category_id, date, SUM(amount) as amount
+                FROM expenses
+                WHERE date BETWEEN ? AND ?
+            '''
+            params = [start_date, end_date]
+
+            if user_id is not None:
+                query += ' AND user_id = ?'
+                params.append(user_id)
+
+            query += ' GROUP BY user_id, category_id, date'
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    def get_budgets(self, month, user_id=None):
+        """Get budgets set for a month as (user_id, category_id, amount) rows.
+        Covers all users unless user_id is given."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            query = '''
+                SELECT user_id, category_id, amount
+                FROM budgets
+                WHERE strftime('%Y-%m', month) = strftime('%Y-%m', ?)
+            '''
+            params = [month]
+
+            if user_id is not None:
+                query += ' AND user_id = ?'
+                params.append(user_id)
+
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
     def create_group(self, name, created_by):
         """Create a new expense sharing group"""
         max_retries = 3
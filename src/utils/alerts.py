@@ -46,6 +46,31 @@ class AlertManager:
             return False
         return (spent / budget) >= threshold
 
+    def check_projected_overspend(self, projected, budget, days_elapsed, min_days=7):
+        """
+        Check if projected month-end spending will exceed the budget
+        Projections made before min_days of the month have elapsed are too noisy to alert on
+        Accepts single values or arrays of projections and budgets
+        """
+        return (budget > 0) & (projected > budget) & (days_elapsed >= min_days)
+
+    def generate_projection_alert(self, category, spent, projected, budget):
+        """Generate an alert message for spending on pace to exceed the budget"""
+        overspend = projected - budget
+
+        message = f"""Spending Forecast for {category}
+
+Current Status:
+- Spent so far: ${spent:.2f}
+- Projected by month end: ${projected:.2f}
+- Budget: ${budget:.2f}
+
+Warning: At your current pace you will exceed your budget by ${overspend:.2f} this month.
+
+This is an automated notification from your expense tracker.
+"""
+        return message
+
     def generate_budget_alert(self, category, spent, budget, threshold=0.9):
         """Generate a budget alert message"""
         percentage = (spent / budget) * 100 if budget > 0 else 0
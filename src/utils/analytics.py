@@ -0,0 +1,164 @@
+import warnings
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+class SpendingAnalytics:
+    def __init__(self, db, window=7, anomaly_window=28, min_spend_days=5, anomaly_z=3.0, outlier_ratio=8.0):
+        self.db = db
+        # Number of trailing days used for rolling means
+        self.window = window
+        # Trailing days, and how many of them need spend, to score anomalies against
+        self.anomaly_window = anomaly_window
+        self.min_spend_days = min_spend_days
+        self.anomaly_z = anomaly_z
+        # How many times the typical spend day a day must be to count as a one-off payment
+        self.outlier_ratio = outlier_ratio
+
+    def build_spend_matrix(self, rows, start_date, end_date):
+        """
+        Pivot (user_id, category_id, date, amount) rows into a dense matrix
+        Returns (keys, dates, matrix) where matrix[i, j] is the spend of keys[i] on dates[j]
+        """
+        dates = pd.date_range(start_date, end_date, freq='D')
+        df = pd.DataFrame(rows, columns=['user_id', 'category_id', 'date', 'amount'])
+        if df.empty:
+            keys = pd.MultiIndex.from_arrays([[], []], names=['user_id', 'category_id'])
+            return keys, dates, np.zeros((0, len(dates)))
+
+        # Factorize users and categories separately and combine the integer codes,
+        # which avoids building a tuple for every row
+        user_codes, users = pd.factorize(df['user_id'])
+        category_codes, categories = pd.factorize(df['category_id'])
+        codes, pairs = pd.factorize(user_codes * len(categories) + category_codes)
+        keys = pd.MultiIndex.from_arrays(
+            [users[pairs // len(categories)], categories[pairs % len(categories)]],
+            names=['user_id', 'category_id']
+        )
+
+        days = dates.get_indexer(pd.to_datetime(df['date']))
+        in_range = days >= 0
+
+        # Scatter every row into its (key, day) cell in a single pass
+        cells = codes[in_range] * len(dates) + days[in_range]
+        matrix = np.bincount(
+            cells,
+            weights=df['amount'].to_numpy(dtype=float)[in_range],
+            minlength=len(keys) * len(dates)
+        ).reshape(len(keys), len(dates))
+        return keys, dates, matrix
+
+    def _trailing_sums(self, matrix, window, include_current):
+        """Sum each row over the trailing window ending at every day"""
+        days = matrix.shape[1]
+        cumulative = np.zeros((matrix.shape[0], days + 1))
+        np.cumsum(matrix, axis=1, out=cumulative[:, 1:])
+
+        end = np.arange(days) + (1 if include_current else 0)
+        start = np.maximum(end - window, 0)
+        return cumulative[:, end] - cumulative[:, start], end - start
+
+    def rolling_mean(self, matrix):
+        """Mean daily spend over the trailing window, including the current day"""
+        sums, counts = self._trailing_sums(matrix, self.window, include_current=True)
+        return sums / counts
+
+    def z_scores(self, matrix):
+        """
+        Score each day's spend against the spend days in the anomaly window before it
+        Zero days are left out so sparse categories do not flag routine purchases
+        Days with fewer than min_spend_days of history or with no variation score 0
+        """
+        spend_days = (matrix > 0).astype(float)
+        sums, _ = self._trailing_sums(matrix, self.anomaly_window, include_current=False)
+        square_sums, _ = self._trailing_sums(matrix ** 2, self.anomaly_window, include_current=False)
+        counts, _ = self._trailing_sums(spend_days, self.anomaly_window, include_current=False)
+        counts = np.rint(counts)
+
+        safe_counts = np.maximum(counts, 1)
+        mean = sums / safe_counts
+        std = np.sqrt(np.clip(square_sums / safe_counts - mean ** 2, 0, None))
+        valid = (counts >= self.min_spend_days) & (std > 1e-6 * np.maximum(np.abs(mean), 1.0))
+
+        scores = np.zeros_like(matrix)
+        np.divide(matrix - mean, std, out=scores, where=valid)
+        return scores
+
+    def daily_pace(self, matrix):
+        """
+        Mean daily spend for each row, leaving out its largest day when that looks like
+        a one-off payment: either the only spend day, or over outlier_ratio times the
+        median of the other spend days
+        """
+        rows = np.arange(matrix.shape[0])
+        largest_day = matrix.argmax(axis=1)
+        largest = matrix[rows, largest_day]
+
+        others = np.where(matrix > 0, matrix, np.nan)
+        others[rows, largest_day] = np.nan
+        with warnings.catch_warnings():
+            # Rows without other spend days have no median
+            warnings.simplefilter('ignore', RuntimeWarning)
+            typical = np.nanmedian(others, axis=1)
+
+        one_off = (largest > 0) & (np.isnan(typical) | (largest > self.outlier_ratio * typical))
+        days = matrix.shape[1]
+        total = matrix.sum(axis=1) - np.where(one_off, largest, 0)
+        return total / np.where(one_off, max(days - 1, 1), days)
+
+    def forecast(self, month, as_of=None, user_id=None):
+        """
+        Project month-end spend for every user and category with expenses in the month
+        Covers all users at once unless user_id is given
+
+        The daily pace is month-to-date spend per elapsed day, leaving out one-off
+        payments such as rent so they are not repeated for every remaining day
+        """
+        month_start = pd.Timestamp(month).normalize().replace(day=1)
+        month_end = month_start + pd.Timedelta(days=month_start.days_in_month - 1)
+        as_of = pd.Timestamp(as_of if as_of is not None else datetime.now()).normalize()
+        as_of = min(max(as_of, month_start), month_end)
+
+        # Load history before the month so early days have full rolling stats
+        history_start = month_start - pd.Timedelta(days=max(self.window, self.anomaly_window))
+        rows = self.db.get_daily_spending(
+            history_start.strftime('%Y-%m-%d'),
+            as_of.strftime('%Y-%m-%d'),
+            user_id
+        )
+        keys, dates, matrix = self.build_spend_matrix(rows, history_start, as_of)
+
+        month_matrix = matrix[:, dates >= month_start]
+        days_elapsed = month_matrix.shape[1]
+        spent = month_matrix.sum(axis=1)
+        daily_pace = self.daily_pace(month_matrix)
+        projected = spent + daily_pace * (month_end - as_of).days
+
+        budgets = pd.DataFrame(
+            self.db.get_budgets(month_start.strftime('%Y-%m-%d'), user_id),
+            columns=['user_id', 'category_id', 'amount']
+        )
+        budget = (
+            budgets.groupby(['user_id', 'category_id'])['amount'].last()
+            .reindex(keys, fill_value=0)
+            .to_numpy(dtype=float)
+        )
+
+        forecast = pd.DataFrame({
+            'spent': spent,
+            'rolling_average': self.rolling_mean(matrix)[:, -1],
+            'daily_pace': daily_pace,
+            'projected': projected,
+            'budget': budget,
+            'days_elapsed': days_elapsed,
+            'z_score': self.z_scores(matrix)[:, -1]
+        }, index=keys).reset_index()
+
+        # Series with spend only in the history window have nothing to forecast
+        forecast = forecast[forecast['spent'] > 0].reset_index(drop=True)
+
+        categories = dict(self.db.get_categories())
+        forecast.insert(2, 'category_name', forecast['category_id'].map(categories))
+        forecast['unusual_spend'] = forecast['z_score'] >= self.anomaly_z
+        return forecast
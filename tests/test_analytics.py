@@ -0,0 +1,122 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from database import Database
+from utils.alerts import AlertManager
+from utils.analytics import SpendingAnalytics
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    # Database writes to database/expenses.db relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    return Database()
+
+@pytest.fixture
+def analytics(db):
+    return SpendingAnalytics(db)
+
+@pytest.fixture
+def matrix():
+    return np.random.default_rng(0).gamma(2.0, 10.0, size=(5, 40))
+
+def test_build_spend_matrix_scatters_rows(analytics):
+    rows = [
+        (1, 1, '2024-03-01', 5.0),
+        (1, 2, '2024-03-02', 3.0),
+        (2, 1, '2024-03-02', 4.0),
+        (1, 1, '2024-03-03', 1.0),
+        (1, 1, '2024-03-03', 2.0),
+        (2, 1, '2024-04-01', 9.0),
+    ]
+    keys, dates, matrix = analytics.build_spend_matrix(rows, '2024-03-01', '2024-03-03')
+
+    assert list(keys) == [(1, 1), (1, 2), (2, 1)]
+    assert len(dates) == 3
+    np.testing.assert_allclose(matrix, [[5, 0, 3], [0, 3, 0], [0, 4, 0]])
+
+def test_rolling_mean_matches_pandas(analytics, matrix):
+    expected = pd.DataFrame(matrix.T).rolling(analytics.window, min_periods=1).mean().T.to_numpy()
+    np.testing.assert_allclose(analytics.rolling_mean(matrix), expected)
+
+def test_z_scores_match_pandas(analytics, matrix):
+    # Every day has spend, so the spend-day statistics match a plain rolling window
+    history = pd.DataFrame(matrix.T).shift(1).rolling(analytics.anomaly_window, min_periods=analytics.min_spend_days)
+    expected = ((pd.DataFrame(matrix.T) - history.mean()) / history.std(ddof=0)).fillna(0).T.to_numpy()
+    np.testing.assert_allclose(analytics.z_scores(matrix), expected)
+
+@pytest.mark.parametrize('history', [
+    [0, 12, 0, 0, 15, 0, 0],
+    [20, 0, 0, 0],
+])
+def test_z_scores_need_enough_spend_days(analytics, history):
+    matrix = np.array([history + [30.0]])
+    assert analytics.z_scores(matrix)[0, -1] == 0
+
+def test_z_scores_on_sparse_series(analytics):
+    # Shopping every few days for a month
+    history = np.zeros(28)
+    history[[0, 4, 9, 13, 18, 24]] = [20, 35, 15, 40, 25, 30]
+    routine = np.append(history, 30.0)
+    splurge = np.append(history, 300.0)
+
+    assert analytics.z_scores(np.array([routine]))[0, -1] < analytics.anomaly_z
+    assert analytics.z_scores(np.array([splurge]))[0, -1] > analytics.anomaly_z
+
+def test_z_scores_ignore_constant_history(analytics):
+    matrix = np.full((1, 10), 10.0)
+    matrix[0, -1] = 200.0
+    assert not analytics.z_scores(matrix).any()
+
+def test_daily_pace_is_unbiased_for_steady_spend(analytics):
+    matrix = np.random.default_rng(1).gamma(2.0, 10.0, size=(5000, 10))
+    assert analytics.daily_pace(matrix).mean() == pytest.approx(matrix.mean(), rel=0.005)
+
+def test_daily_pace_keeps_weekly_trips(analytics):
+    matrix = np.zeros((1, 14))
+    matrix[0, [0, 7]] = 200
+    assert analytics.daily_pace(matrix)[0] == pytest.approx(400 / 14)
+
+def test_daily_pace_leaves_out_one_off_payment(analytics):
+    matrix = np.full((1, 10), 20.0)
+    matrix[0, 0] = 520
+    assert analytics.daily_pace(matrix)[0] == pytest.approx(20)
+
+def test_forecast_projects_steady_spending(db, analytics):
+    user_id = db.add_user('steady', 'steady@example.com')
+    food = db.get_category_id('Food')
+    db.set_budget(user_id, food, 1000, datetime(2024, 10, 1))
+    db.add_expense(user_id, db.get_category_id('Transport'), 15.0, 'Bus', '2024-09-28')
+    for day in range(1, 11):
+        db.add_expense(user_id, food, 40.0, 'Groceries', f'2024-10-{day:02d}')
+
+    forecast = analytics.forecast('2024-10-01', as_of='2024-10-10')
+
+    # Transport only has spend before the month, so it is not forecast
+    assert forecast['category_name'].tolist() == ['Food']
+    row = forecast.iloc[0]
+    assert row['spent'] == pytest.approx(400)
+    assert row['daily_pace'] == pytest.approx(40)
+    assert row['projected'] == pytest.approx(400 + 40 * 21)
+    assert row['days_elapsed'] == 10
+    assert AlertManager().check_projected_overspend(row['projected'], row['budget'], row['days_elapsed'])
+
+@pytest.mark.parametrize('as_of', ['2024-10-01', '2024-10-10', '2024-10-20'])
+def test_forecast_does_not_extrapolate_single_large_payment(db, analytics, as_of):
+    user_id = db.add_user('renter', 'renter@example.com')
+    bills = db.get_category_id('Bills')
+    db.set_budget(user_id, bills, 1000, datetime(2024, 10, 1))
+    db.add_expense(user_id, bills, 500.0, 'Rent', '2024-10-01')
+
+    row = analytics.forecast('2024-10-01', as_of=as_of, user_id=user_id).iloc[0]
+
+    assert row['projected'] == pytest.approx(500)
+    assert not AlertManager().check_projected_overspend(row['projected'], row['budget'], row['days_elapsed'])
+
+def test_overspend_alert_waits_for_min_days():
+    alerts = AlertManager()
+    assert not alerts.check_projected_overspend(1500, 1000, days_elapsed=3)
+    assert alerts.check_projected_overspend(1500, 1000, days_elapsed=7)
+    assert not alerts.check_projected_overspend(1500, 0, days_elapsed=7)